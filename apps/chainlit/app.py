@@ -7,21 +7,20 @@ that help users manage their MyPetParlor App portal through various APIs.
 Author: MyBusiness App (Pty) Ltd
 """
 
-import os
-import logging
 import json
-from typing import Optional, List, Dict, Any
-from datetime import datetime
-from pathlib import Path
+import logging
+import re
+from typing import Optional, List, Dict
+from datetime import date, datetime
 import asyncio
+import time
 
 # Third-party imports
 import chainlit as cl
-from azure.ai.projects import AIProjectClient
 from semantic_kernel.agents import AzureAIAgent, AzureAIAgentThread
 from semantic_kernel.functions import kernel_function
-from pydantic import BaseModel, Field, validator
-from azure.identity import DefaultAzureCredential
+from pydantic import BaseModel, Field, ValidationError, field_validator
+from azure.identity.aio import DefaultAzureCredential
 
 # Initialize Azure credentials
 credential = DefaultAzureCredential()
@@ -35,28 +34,97 @@ logger = logging.getLogger(__name__)
 from custom_agents.setup_guide import SetupGuideClient
 from custom_agents.read_api import ReadAPIClient
 from custom_agents.triage import TriageClient
-from telemetry.appinsights import AzureMonitor
+from telemetry.appinsights import configure_application_insights
+
+# Application Insights is set up once, by the first chat session, on Chainlit's event loop
+telemetry_lock = asyncio.Lock()
+telemetry_initialized = False
 
 # Enable Azure Monitor tracing
 async def init_application_insights():
-    connection_string = await client.telemetry.get_connection_string()
-    if not connection_string:
-        print("Application Insights was not enabled for this project.")
-        print("Enable it via the 'Tracing' tab in your AI Foundry project page.")
-        exit()
-    azureMonitor = AzureMonitor(connection_string=connection_string)
-    azureMonitor.set_up_logging()
-    azureMonitor.set_up_tracing()
-    azureMonitor.set_up_metrics()
+    global telemetry_initialized
+    
+    async with telemetry_lock:
+        if telemetry_initialized:
+            return
+        
+        # Telemetry is best effort: a project without Application Insights, or an
+        # unreachable service, must never prevent a chat session from starting
+        try:
+            connection_string = await client.telemetry.get_connection_string()
+            if not connection_string:
+                logger.warning("Application Insights was not enabled for this project. "
+                               "Enable it via the 'Tracing' tab in your AI Foundry project page.")
+            else:
+                configure_application_insights(connection_string)
+        except Exception as e:
+            logger.warning("Application Insights could not be configured: %s", e)
+        finally:
+            telemetry_initialized = True
+
+# Greeting sent at the start of every chat session
+WELCOME_MESSAGE = "👋 Welcome to MyPetParlor AI Assistant! How can I help you today?"
+
+# Fixed texts of the status, fallback and error messages
+THINKING_MESSAGE = "🧠 Analyzing your request..."
+SCHEDULE_MESSAGE = "Here's your optimized schedule:"
+FALLBACK_MESSAGE = ("I processed your request but couldn't generate a proper response. "
+                    "Please try a more specific question about bookings, customers, teams, or setup guides.")
+INIT_ERROR_MESSAGE = "❌ Error initializing the assistant. Please try refreshing the page or contact support."
+ERROR_MESSAGE_TEMPLATE = "❌ Error: {error}. Please try again or contact support if the issue persists."
+
+# Streamed tokens are sent to the UI once this many characters have accumulated...
+STREAM_FLUSH_CHARS = 64
+# ...or once this many seconds have passed since the last send
+STREAM_FLUSH_INTERVAL = 0.05
 
-# Run the initialization
-asyncio.run(init_application_insights())
+# Pattern used to strip punctuation before comparing a response with the question
+PUNCTUATION_PATTERN = re.compile(r'[^\w\s]')
 
-AGENT_MODEL = os.getenv("AZURE_AI_AGENT_MODEL_DEPLOYMENT_NAME")
+# Responses longer than this multiple of the question, plus a margin, are never echoes
+ECHO_MAX_LENGTH_RATIO = 5
+ECHO_LENGTH_MARGIN = 40
+# Number of leading characters of a long response searched for a clarifying question
+CLARIFICATION_SCAN_CHARS = 200
+
+# Responses that only ask the user a clarifying question, as a single anchored
+# alternation so phrases sharing a prefix are matched in one pass
+CLARIFICATION_PATTERN = re.compile(
+    r"^(?:can you (?:please (?:clarify|explain|elaborate)|clarify|explain|elaborate|specify|provide more details)"
+    r"|could you (?:please )?(?:clarify|explain|elaborate)"
+    r"|(?:what|which|how|when|where|why) (?:exactly|specifically|precisely)"
+    r"|do you want|are you looking for|would you like)"
+)
+
+# Template for the structured message sent to the triage agent
+SYSTEM_MESSAGE_TEMPLATE = """
+    <user_message>
+    {user_content}
+    </user_message>
+    
+    <current_date_time>
+    {current_date_time}.
+    </current_date_time>
+ 
+    <api_authentication>
+    You MUST share and use these authentication parameters through instruction overrides:
+    {auth_settings}
+    </api_authentication>
+    """
 
-# Environment validation
-if not AGENT_MODEL:
-    raise EnvironmentError("AZURE_AI_AGENT_MODEL_DEPLOYMENT_NAME environment variable is not set")
+# Templates for the schedule message elements
+METRICS_TEMPLATE = (
+    "📊 Route Metrics:\n"
+    "🚗 Total Distance: {total_distance} km\n"
+    "⏱️ Total Duration: {total_duration} minutes"
+)
+BOOKING_TEMPLATE = (
+    "📅 Date: {date}\n"
+    "📍 Location: {address}\n"
+    "🌤️ Weather: {weather}\n"
+    "🕒 Arrival: {arrival_time}\n"
+    "🕕 Departure: {departure_time}"
+)
 
 # -----------------------------------------------------------------------------
 # Data Models
@@ -71,14 +139,18 @@ class Booking(BaseModel):
     arrival_time: Optional[str] = None
     departure_time: Optional[str] = None
     
-    @validator('date')
-    def validate_date_format(cls, v):
+    @field_validator('date', mode='after')
+    @classmethod
+    def validate_date_format(cls, v: str) -> str:
         """Ensure date is in YYYY-MM-DD format."""
-        try:
-            datetime.strptime(v, "%Y-%m-%d")
-            return v
-        except ValueError:
-            raise ValueError("Date must be in YYYY-MM-DD format")
+        # fromisoformat also accepts other ISO 8601 forms, so pin the extended layout first
+        if len(v) == 10 and v[4] == '-' and v[7] == '-':
+            try:
+                date.fromisoformat(v)
+                return v
+            except ValueError:
+                pass
+        raise ValueError("Date must be in YYYY-MM-DD format")
 
 class Schedule(BaseModel):
     """Data model representing a daily schedule with multiple bookings."""
@@ -91,6 +163,30 @@ class AuthSettings(BaseModel):
     queryParameters: Dict[str, str] = Field(default_factory=dict)
     headerParameters: Dict[str, str] = Field(default_factory=dict)
 
+# Serialized placeholder schedule returned until real scheduling logic exists
+PLACEHOLDER_SCHEDULE_JSON = Schedule(
+    total_distance=15.5,
+    total_duration=120,
+    bookings=[
+        Booking(
+            id="booking1",
+            date="2024-03-20",
+            address="123 Main St",
+            weather="Sunny",
+            arrival_time="09:00",
+            departure_time="10:00"
+        ),
+        Booking(
+            id="booking2",
+            date="2024-03-20",
+            address="456 Oak Ave",
+            weather="Cloudy",
+            arrival_time="11:00",
+            departure_time="12:30"
+        )
+    ]
+).model_dump_json()
+
 # -----------------------------------------------------------------------------
 # Plugin Classes
 # -----------------------------------------------------------------------------
@@ -111,29 +207,7 @@ class SchedulingPlugin:
         """
         # TODO: Replace with actual scheduling optimization logic
         # This is just a placeholder implementation
-        schedule = Schedule(
-            total_distance=15.5,
-            total_duration=120,
-            bookings=[
-                Booking(
-                    id="booking1",
-                    date="2024-03-20",
-                    address="123 Main St",
-                    weather="Sunny",
-                    arrival_time="09:00",
-                    departure_time="10:00"
-                ),
-                Booking(
-                    id="booking2",
-                    date="2024-03-20",
-                    address="456 Oak Ave",
-                    weather="Cloudy",
-                    arrival_time="11:00",
-                    departure_time="12:30"
-                )
-            ]
-        )
-        return schedule.model_dump_json()
+        return PLACEHOLDER_SCHEDULE_JSON
 
 class ImporterPlugin:
     """Plugin for importing and processing files like customer lists or booking data."""
@@ -152,9 +226,17 @@ class ImporterPlugin:
         """
         # TODO: Replace with actual file processing logic
         # This is just a placeholder implementation
-        logger.info(f"Processing file: {file_path} of type {file_type}")
+        logger.info("Processing file: %s of type %s", file_path, file_type)
         return f"Successfully processed {file_path} of type {file_type}"
 
+# Plugins are stateless, so a single instance of each is shared by all sessions
+scheduling_plugin = SchedulingPlugin()
+importer_plugin = ImporterPlugin()
+
+# Triage agent shared by all sessions, created by the first session (see get_triage_agent)
+triage_agent_lock = asyncio.Lock()
+shared_triage_agent: Optional[AzureAIAgent] = None
+
 # -----------------------------------------------------------------------------
 # ChainLit Event Handlers
 # -----------------------------------------------------------------------------
@@ -169,57 +251,35 @@ async def start():
     logger.info("Starting new chat session")
     
     try:
-        # Send a welcome message to the user
-        await cl.Message(
-            content="👋 Welcome to MyPetParlor AI Assistant! How can I help you today?",
-        ).send()
-        
-        # Initialize specialized clients
-        logger.info("Initializing specialized clients")
-        setup_guide_client = SetupGuideClient(client=client)
-        read_api_client = ReadAPIClient(client=client)
-        triage_client = TriageClient(client=client)
-        
-        # Create plugins
-        scheduling_plugin = SchedulingPlugin()
-        importer_plugin = ImporterPlugin()
-        
-        # Initialize agents from clients
-        logger.info("Initializing agents from clients")
-        setup_guide_agent = await setup_guide_client.initialize()
-        api_agents = await read_api_client.initialize(
-            scheduling_plugin=scheduling_plugin,
-            importer_plugin=importer_plugin
-        )
-        
-        # Initialize triage agent with all plugins
-        triage_agent = await triage_client.initialize(
-            setup_guide_agent=setup_guide_agent,
-            api_agents=api_agents
+        # Send a welcome message to the user while getting the triage agent shared
+        # by all sessions, running a copilot function call to obtain the
+        # authentication object and enabling telemetry on the first session
+        logger.info("Retrieving agents and authentication settings")
+        welcome_msg = cl.Message(content=WELCOME_MESSAGE)
+        fn = cl.CopilotFunction(name="get_copilot_auth_settings", args={})
+        _, triage_agent, auth_settings, _ = await asyncio.gather(
+            welcome_msg.send(),
+            get_triage_agent(),
+            fn.acall(),
+            init_application_insights()
         )
         
         # Create a new thread for the chat session
         thread = AzureAIAgentThread(client=client)
         
-        # Add Chainlit filter to capture function calls as Steps
-        sk_filter = cl.SemanticKernelFilter(kernel=triage_agent.kernel)
-        
-        # Run a copilot function call to obtain the authentication object
-        logger.info("Retrieving authentication settings")
-        fn = cl.CopilotFunction(name="get_copilot_auth_settings", args={})
-        auth_settings = await fn.acall()
-        
-        # Store session variables - including client for proper cleanup
-        cl.user_session.set("auth_settings", auth_settings)
-        cl.user_session.set("client", client)
+        # Store session variables
+        # Authentication settings are fixed for the session, so serialize them once;
+        # missing settings leave the key unset so messages are refused
+        if auth_settings is None:
+            logger.warning("No authentication settings returned by the copilot function")
+        else:
+            cl.user_session.set("auth_settings_json", json.dumps(auth_settings))
         cl.user_session.set("triage_agent", triage_agent)
         cl.user_session.set("thread", thread)
 
     except Exception as e:
-        logger.error(f"Error initializing chat session: {str(e)}", exc_info=True)
-        await cl.Message(
-            content="❌ Error initializing the assistant. Please try refreshing the page or contact support.",
-        ).send()
+        logger.error("Error initializing chat session: %s", e, exc_info=True)
+        await cl.Message(content=INIT_ERROR_MESSAGE).send()
 
 @cl.on_message
 async def main(message: cl.Message):
@@ -229,235 +289,413 @@ async def main(message: cl.Message):
     Args:
         message: The message received from the user
     """
-    logger.info(f"Processing new message: {message.id}")
+    logger.debug("Processing new message: %s", message.id)
     
     try:
         # Retrieve session variables
         triage_agent: AzureAIAgent = cl.user_session.get("triage_agent")
         thread: AzureAIAgentThread = cl.user_session.get("thread")
-        auth_settings: dict = cl.user_session.get("auth_settings")
+        auth_settings_json: str = cl.user_session.get("auth_settings_json")
         
-        if not all([triage_agent, thread, auth_settings]):
+        if triage_agent is None or thread is None or auth_settings_json is None:
             raise ValueError("Session data is missing. Please restart the chat.")
         
         # Create a thinking message to indicate processing
-        thinking_msg = cl.Message(content="🧠 Analyzing your request...", author="System")
+        thinking_msg = cl.Message(content=THINKING_MESSAGE, author="System")
         await thinking_msg.send()
         
         # Create a structured system message with authentication details
-        system_message = create_system_message(message.content, auth_settings)
-        
-        # Add user message to thread
-        logger.info("Sending message to agents for processing")
-        thread_response = await triage_agent.get_response(
-            thread=thread,
-            messages=[system_message]
-        )
+        system_message = create_system_message(message.content, auth_settings_json)
         
-        # Delete the thinking message
-        await thinking_msg.remove()
+        # Normalize the question once for the echo checks on the response
+        norm_question = normalize_text(message.content)
         
-        # Check if we got a valid response
-        if not thread_response or not thread_response.content:
-            logger.warning("Empty response received from agent")
-            await cl.Message(
-                content="I couldn't generate a proper response. Could you please rephrase your question?",
-            ).send()
-            return
-            
         # Create a Chainlit message for the response stream
         answer = cl.Message(content="")
+        stream_buffer = TokenStreamBuffer(answer)
+        
+        # A response opening with "{" may be schedule JSON, so it is held back and
+        # parsed once the stream completes instead of being streamed as text
+        held_tokens: List[str] = []
+        hold_response = None
+        schedule_data = None
         
-        # Stream the response (with additional check to avoid echoing the question)
-        async for content in triage_agent.invoke_stream(thread=thread):
-            if content.content:
-                content_text = content.content.content if hasattr(content.content, 'content') else content.content
-                
-                # Skip if the content matches the user's question too closely
-                if is_echo_of_question(content_text, message.content):
-                    logger.warning("Detected echo of user question, skipping")
-                    continue
+        # Add user message to thread and stream the response in a single agent run
+        # (with additional check to avoid echoing the question)
+        logger.debug("Sending message to agents for processing")
+        try:
+            async for content in triage_agent.invoke_stream(
+                thread=thread,
+                messages=[system_message]
+            ):
+                # Delete the thinking message once the agent starts responding
+                if thinking_msg:
+                    await thinking_msg.remove()
+                    thinking_msg = None
+                    
+                if content.content:
+                    content_text = content.content.content if hasattr(content.content, 'content') else content.content
+                    
+                    # Skip if the content matches the user's question too closely
+                    if is_echo_of_question(content_text, norm_question):
+                        logger.warning("Detected echo of user question, skipping")
+                        continue
                     
-                # Try to parse as schedule data
-                try:
-                    schedule_data = parse_schedule_data(content_text)
-                    if schedule_data:
-                        await send_schedule_message(schedule_data)
+                    # Regular content, streamed in coalesced chunks
+                    if hold_response is False:
+                        await stream_buffer.add(content_text)
                         continue
-                except Exception as e:
-                    logger.debug(f"Not schedule data, streaming regular content: {str(e)}")
-                
-                # Regular content, stream token by token
-                await answer.stream_token(content_text)
+                    
+                    # Decide whether to hold the response on its first non-whitespace character
+                    held_tokens.append(content_text)
+                    if hold_response is None and content_text.strip():
+                        hold_response = content_text.lstrip().startswith("{")
+                        if not hold_response:
+                            await stream_buffer.add("".join(held_tokens))
+                            held_tokens.clear()
+        finally:
+            # Stop timed flushes so nothing is streamed after an error is reported
+            await stream_buffer.close()
+        
+        # Parse a held-back response as schedule data, streaming it as text otherwise
+        if held_tokens:
+            held_content = "".join(held_tokens)
+            schedule_data = parse_schedule_data(held_content)
+            if not schedule_data:
+                await stream_buffer.add(held_content)
+        
+        # Stream any tokens still held in the buffer
+        await stream_buffer.flush()
+        
+        # Delete the thinking message if the agent produced no output at all
+        if thinking_msg:
+            logger.warning("Empty response received from agent")
+            await thinking_msg.remove()
         
-        # Send the final message if not already sent and not empty
-        if answer.content and not is_echo_of_question(answer.content, message.content):
+        # Send the schedule, or the final message if not empty
+        if schedule_data:
+            await send_schedule_message(answer, schedule_data)
+        elif answer.content and not is_echo_of_question(answer.content, norm_question):
             await answer.send()
         else:
             # Fallback if we somehow got an empty or echo response
-            await cl.Message(
-                content="I processed your request but couldn't generate a proper response. Please try a more specific question about bookings, customers, teams, or setup guides.",
-            ).send()
+            await cl.Message(content=FALLBACK_MESSAGE).send()
             
     except Exception as e:
-        logger.error(f"Error processing the message: {str(e)}", exc_info=True)
-        await cl.Message(
-            content=f"❌ Error: {str(e)}. Please try again or contact support if the issue persists.",
-        ).send()
+        logger.error("Error processing the message: %s", e, exc_info=True)
+        await cl.Message(content=ERROR_MESSAGE_TEMPLATE.format(error=e)).send()
 
 @cl.on_chat_end
 async def end():
     """
-    Clean up resources when chat ends to prevent memory leaks and ensure proper resource disposal.
+    Clean up resources when chat ends.
+    
+    The Azure AI Agent client is shared by all chat sessions and stays open for
+    the lifetime of the process, so it is not closed here but in shutdown().
+    """
+    logger.info("Ending chat session")
+    
+    # Delete the session's thread if the agent ever created it remotely
+    thread: AzureAIAgentThread = cl.user_session.get("thread")
+    if thread is not None and thread.id is not None:
+        try:
+            await thread.delete()
+        except Exception as e:
+            logger.warning("Error deleting chat thread: %s", e)
+
+@cl.on_app_shutdown
+async def shutdown():
+    """
+    Close the Azure AI Agent client and credential shared by all chat sessions
+    when the Chainlit server stops.
     """
-    logger.info("Ending chat session and cleaning up resources")
+    logger.info("Closing Azure AI Agent client")
+    
     try:
-        # Get the client from the session
-        client = cl.user_session.get("client")
-        if client:
-            # Close the client properly to release resources
+        try:
             await client.close()
-            logger.info("Azure AI Agent client closed successfully")
+        finally:
+            await credential.close()
+        logger.info("Azure AI Agent client closed successfully")
     except Exception as e:
-        logger.error(f"Error closing client during chat end: {str(e)}", exc_info=True)
+        logger.warning("Error closing Azure AI Agent client: %s", e)
 
 # -----------------------------------------------------------------------------
 # Helper Functions
 # -----------------------------------------------------------------------------
 
-def create_system_message(user_content: str, auth_settings: dict) -> str:
+async def get_triage_agent() -> AzureAIAgent:
+    """
+    Get the triage agent shared by all chat sessions, creating it on first use.
+    
+    The agents hold no per-user state (each session has its own thread), so the
+    specialized agents, their plugins and the Chainlit filter are set up only once.
+    
+    Returns:
+        The triage agent with all specialized agents as plugins
+    """
+    global shared_triage_agent
+    
+    async with triage_agent_lock:
+        if shared_triage_agent is not None:
+            return shared_triage_agent
+        
+        # Initialize specialized clients
+        logger.info("Initializing specialized clients")
+        setup_guide_client = SetupGuideClient(client=client)
+        read_api_client = ReadAPIClient(client=client)
+        triage_client = TriageClient(client=client)
+        
+        # Initialize agents from clients; the specialized agents are independent
+        logger.info("Initializing agents from clients")
+        setup_guide_agent, api_agents, data_analysis_agent = await asyncio.gather(
+            setup_guide_client.initialize(),
+            read_api_client.initialize(
+                scheduling_plugin=scheduling_plugin,
+                importer_plugin=importer_plugin
+            ),
+            triage_client.create_data_analysis_agent()
+        )
+        
+        # Initialize triage agent with all plugins
+        triage_agent = await triage_client.initialize(
+            setup_guide_agent=setup_guide_agent,
+            api_agents=api_agents,
+            data_analysis_agent=data_analysis_agent
+        )
+        
+        # Add Chainlit filter to capture function calls as Steps; steps are
+        # attached to whichever session is active when a function runs
+        cl.SemanticKernelFilter(kernel=triage_agent.kernel)
+        
+        shared_triage_agent = triage_agent
+        return shared_triage_agent
+
+class TokenStreamBuffer:
+    """Coalesces streamed tokens so a Chainlit message is updated in larger chunks."""
+    
+    def __init__(self, message: cl.Message):
+        """
+        Initialize the buffer for a message.
+        
+        Args:
+            message: The Chainlit message receiving the streamed tokens
+        """
+        self.message = message
+        self.tokens: List[str] = []
+        self.size = 0
+        self.last_flush = time.monotonic()
+        self.flush_timer: Optional[asyncio.TimerHandle] = None
+        self.flush_task: Optional[asyncio.Task] = None
+    
+    async def add(self, token: str) -> None:
+        """
+        Add a token, flushing once enough text or time has accumulated.
+        
+        Tokens left in the buffer are flushed after STREAM_FLUSH_INTERVAL even if
+        no further token arrives, e.g. while the agent waits on a function call.
+        
+        Args:
+            token: The streamed token to add
+        """
+        self.tokens.append(token)
+        self.size += len(token)
+        if self.size >= STREAM_FLUSH_CHARS or time.monotonic() - self.last_flush >= STREAM_FLUSH_INTERVAL:
+            await self.flush()
+        elif self.flush_timer is None and self.flush_task is None:
+            self._schedule_flush()
+    
+    def _schedule_flush(self) -> None:
+        """Flush the buffered tokens once STREAM_FLUSH_INTERVAL has passed."""
+        self.flush_timer = asyncio.get_running_loop().call_later(STREAM_FLUSH_INTERVAL, self._start_timed_flush)
+    
+    def _start_timed_flush(self) -> None:
+        """Start sending the buffered tokens from the flush timer."""
+        self.flush_timer = None
+        self.flush_task = asyncio.create_task(self._timed_flush())
+    
+    async def _timed_flush(self) -> None:
+        """
+        Send the buffered tokens, scheduling another flush for tokens added meanwhile.
+        
+        If the send fails the task is kept, so the error is raised by the next flush or close.
+        """
+        await self._send()
+        self.flush_task = None
+        if self.tokens:
+            self._schedule_flush()
+    
+    async def _send(self) -> None:
+        """Stream the buffered tokens to the message."""
+        if self.tokens:
+            # Take the text before sending, as tokens may be added while the send is awaited
+            text = "".join(self.tokens)
+            self.tokens.clear()
+            self.size = 0
+            await self.message.stream_token(text)
+        self.last_flush = time.monotonic()
+    
+    async def _stop_timed_flush(self) -> None:
+        """Wait for a timed send in progress to finish and cancel any pending flush timer."""
+        try:
+            if self.flush_task is not None:
+                task, self.flush_task = self.flush_task, None
+                await task
+        finally:
+            if self.flush_timer is not None:
+                self.flush_timer.cancel()
+                self.flush_timer = None
+    
+    async def flush(self) -> None:
+        """Stream all buffered tokens to the message, after any timed send in progress."""
+        await self._stop_timed_flush()
+        await self._send()
+    
+    async def close(self) -> None:
+        """
+        Stop timed flushing, waiting for a timed send in progress to finish.
+        
+        Buffered tokens are kept and only streamed by an explicit flush, so nothing
+        is sent once the response stream has failed.
+        """
+        try:
+            await self._stop_timed_flush()
+        except Exception as e:
+            logger.warning("Error streaming buffered tokens: %s", e)
+
+def create_system_message(user_content: str, auth_settings_json: str) -> str:
     """
     Create a structured system message with user content and authentication details.
     
     Args:
         user_content: The message from the user
-        auth_settings: Authentication settings for API access
+        auth_settings_json: Authentication settings for API access, serialized as JSON
         
     Returns:
         Formatted system message string
     """
     current_date_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     
-    system_message = f"""
-    <user_message>
-    {user_content}
-    </user_message>
+    system_message = SYSTEM_MESSAGE_TEMPLATE.format(
+        user_content=user_content,
+        current_date_time=current_date_time,
+        auth_settings=auth_settings_json
+    )
+    logger.debug("System message: %s", system_message)
+    return system_message
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize text for echo comparison.
     
-    <current_date_time>
-    {current_date_time}.
-    </current_date_time>
- 
-    <api_authentication>
-    You MUST share and use these authentication parameters through instruction overrides:
-    {auth_settings}
-    </api_authentication>
+    Args:
+        text: The text to normalize
+    
+    Returns:
+        Lowercase text with punctuation removed and whitespace collapsed
     """
-    logger.info(f"System message: {system_message}")
-    return system_message
+    text = PUNCTUATION_PATTERN.sub('', text.lower())
+    return ' '.join(text.split())
 
-def is_echo_of_question(response: str, question: str) -> bool:
+def is_echo_of_question(response: str, norm_question: str) -> bool:
     """
     Check if the response is just echoing the user's question.
     
     Args:
         response: The response text to check
-        question: The original question from the user
+        norm_question: The original question from the user, already passed through normalize_text
         
     Returns:
         True if the response appears to be an echo of the question, False otherwise
     """
-    # Strip punctuation and whitespace for comparison
-    import re
-    
-    def normalize_text(text):
-        # Convert to lowercase, remove extra whitespace and punctuation
-        text = text.lower().strip()
-        text = re.sub(r'[^\w\s]', '', text)
-        text = re.sub(r'\s+', ' ', text)
-        return text
+    # A response much longer than the question cannot echo it, so only the opening
+    # characters are needed to look for a clarifying question
+    if len(response) > len(norm_question) * ECHO_MAX_LENGTH_RATIO + ECHO_LENGTH_MARGIN:
+        norm_opening = normalize_text(response[:CLARIFICATION_SCAN_CHARS])
+        return CLARIFICATION_PATTERN.match(norm_opening) is not None
     
+    # Strip punctuation and whitespace for comparison
     norm_response = normalize_text(response)
-    norm_question = normalize_text(question)
     
     # Check if the response is just the question or starts with it
     if norm_response == norm_question:
         return True
     
     # Check if response is mostly just the question with some minor additions
-    if norm_response.startswith(norm_question) and len(norm_response) < len(norm_question) + 20:
+    if len(norm_response) < len(norm_question) + 20 and norm_response.startswith(norm_question):
         return True
         
     # Check if response is just asking a clarifying question without providing information
-    clarification_patterns = [
-        r"^can you (clarify|explain|elaborate|specify|provide more details)",
-        r"^(what|which|how|when|where|why) (exactly|specifically|precisely)",
-        r"^(do you want|are you looking for|would you like)",
-        r"^(could you|can you) (please |)?(clarify|explain|elaborate)"
-    ]
+    return CLARIFICATION_PATTERN.match(norm_response) is not None
+
+def looks_like_schedule(content: str) -> bool:
+    """
+    Cheaply check whether content could be a serialized Schedule.
     
-    for pattern in clarification_patterns:
-        if re.match(pattern, norm_response):
-            return True
+    Args:
+        content: Content to check
     
-    return False
+    Returns:
+        True if the content is a JSON object mentioning bookings, False otherwise
+    """
+    text = content.lstrip()
+    return text.startswith("{") and '"bookings"' in text
 
-def parse_schedule_data(content: Any) -> Optional[Schedule]:
+def parse_schedule_data(content: str) -> Optional[Schedule]:
     """
     Try to parse content as Schedule data.
     
+    Content that cannot be a serialized Schedule is rejected without
+    invoking the JSON parser.
+    
     Args:
         content: Content to parse
         
     Returns:
         Schedule object if parsing succeeds, None otherwise
     """
+    if not looks_like_schedule(content):
+        return None
+    
     try:
-        # Handle different content formats from agents
-        content_str = content
-        if hasattr(content, 'content'):
-            content_str = content.content
-            
-        schedule_data = Schedule.model_validate_json(content_str)
+        schedule_data = Schedule.model_validate_json(content)
         return schedule_data
-    except Exception:
+    except ValidationError:
         return None
 
-async def send_schedule_message(schedule_data: Schedule) -> None:
+async def send_schedule_message(message: cl.Message, schedule_data: Schedule) -> None:
     """
     Send a formatted message with schedule data.
     
     Args:
+        message: The response message to fill with the schedule and send
         schedule_data: Schedule data to display
     """
-    elements = []
-    
-    # Add metrics if available
-    if schedule_data.total_distance is not None:
-        elements.append(
-            cl.Text(name="metrics", content=f"""
-            📊 Route Metrics:
-            🚗 Total Distance: {schedule_data.total_distance} km
-            ⏱️ Total Duration: {schedule_data.total_duration} minutes
-            """)
-        )
-    
     # Add each booking as a separate element
-    for booking in schedule_data.bookings:
-        elements.append(
-            cl.Text(name=booking.id, content=f"""
-            📅 Date: {booking.date}
-            📍 Location: {booking.address}
-            🌤️ Weather: {booking.weather or 'N/A'}
-            🕒 Arrival: {booking.arrival_time or 'N/A'}
-            🕕 Departure: {booking.departure_time or 'N/A'}
-            """)
-        )
+    booking_elements = [
+        cl.Text(name=booking.id, content=BOOKING_TEMPLATE.format(
+            date=booking.date,
+            address=booking.address,
+            weather=booking.weather or 'N/A',
+            arrival_time=booking.arrival_time or 'N/A',
+            departure_time=booking.departure_time or 'N/A'
+        ))
+        for booking in schedule_data.bookings
+    ]
+    
+    # Show the metrics first if available, followed by the bookings
+    metrics_elements = [
+        cl.Text(name="metrics", content=METRICS_TEMPLATE.format(
+            total_distance=schedule_data.total_distance,
+            total_duration=schedule_data.total_duration
+        ))
+    ] if schedule_data.total_distance is not None else []
+    elements = metrics_elements + booking_elements
     
     # Send as a rich message with elements
-    await cl.Message(
-        content="Here's your optimized schedule:",
-        elements=elements
-    ).send()
+    message.content = SCHEDULE_MESSAGE
+    message.elements = elements
+    await message.send()
 
 # -----------------------------------------------------------------------------
 # Main entry point (for direct execution)
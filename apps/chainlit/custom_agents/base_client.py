@@ -1,6 +1,10 @@
-from typing import Any, Coroutine, List, Optional
+from collections import defaultdict
+from typing import Any, Coroutine, Dict, List, Optional
 from azure.ai.projects import AIProjectClient
 from semantic_kernel.agents import Agent
+import asyncio
+import hashlib
+import json
 import os
 import logging
 
@@ -12,8 +16,72 @@ class BaseClient:
     Base class for creating and managing clients with Azure AI Agents.
     """
     
-    # Get the model deployment name from environment variables
+    # Get the model deployment name from environment variables, failing fast at import if unset
     AGENT_MODEL = os.getenv("AZURE_AI_AGENT_MODEL_DEPLOYMENT_NAME")
+    if not AGENT_MODEL:
+        raise EnvironmentError("AZURE_AI_AGENT_MODEL_DEPLOYMENT_NAME environment variable is not set")
+    
+    # Metadata key used to tag remote agents with a hash of their configuration
+    CONFIG_HASH_KEY = "config_hash"
+    
+    # Number of remote agents fetched per page when looking for a reusable agent
+    AGENT_LOOKUP_LIMIT = 100
+    
+    # Agent definitions resolved by this process, keyed by configuration hash
+    _definitions: Dict[str, Any] = {}
+    _definition_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+    
+    @staticmethod
+    def _config_hash(name: str, description: str, instructions: str,
+                     tools: Optional[List] = None) -> str:
+        """
+        Compute a stable hash of an agent's configuration.
+        
+        Args:
+            name: Name of the agent
+            description: Short description of the agent's purpose
+            instructions: Detailed instructions for the agent
+            tools: Optional list of tool definitions
+        
+        Returns:
+            Short hex digest identifying the configuration
+        """
+        config = {
+            "model": BaseClient.AGENT_MODEL,
+            "name": name,
+            "description": description,
+            "instructions": instructions,
+            "tools": [tool.as_dict() for tool in tools or []]
+        }
+        payload = json.dumps(config, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+    
+    @staticmethod
+    async def _find_agent(client: AIProjectClient, name: str, config_hash: str) -> Optional[Any]:
+        """
+        Look up an existing remote agent created with the same configuration.
+        
+        Agents are listed a page at a time, most recent first, until a match is
+        found or every agent in the project has been checked.
+        
+        Args:
+            client: AzureAIAgent client
+            name: Name of the agent
+            config_hash: Hash of the agent configuration
+        
+        Returns:
+            Agent definition object if a matching agent exists, None otherwise
+        """
+        after = None
+        while True:
+            agents = await client.agents.list_agents(limit=BaseClient.AGENT_LOOKUP_LIMIT, after=after)
+            for agent in agents.data:
+                metadata = agent.metadata or {}
+                if agent.name == name and metadata.get(BaseClient.CONFIG_HASH_KEY) == config_hash:
+                    return agent
+            if not agents.has_more or not agents.data:
+                return None
+            after = agents.last_id
     
     @staticmethod
     async def create_agent(client: AIProjectClient, name: str, description: str, 
@@ -21,6 +89,10 @@ class BaseClient:
         """
         Create an Azure AI Agent with the specified parameters.
         
+        An existing remote agent with an identical configuration is reused
+        instead of creating a new one, and the resolved definition is cached
+        for the lifetime of the process.
+        
         Args:
             client: AzureAIAgent client
             name: Name of the agent
@@ -31,18 +103,34 @@ class BaseClient:
         Returns:
             Agent definition object
         """
-        if not BaseClient.AGENT_MODEL:
-            raise EnvironmentError("AZURE_AI_AGENT_MODEL_DEPLOYMENT_NAME environment variable is not set")
+        config_hash = BaseClient._config_hash(name, description, instructions, tools)
+        definition = BaseClient._definitions.get(config_hash)
+        if definition:
+            return definition
         
-        agent_args = {
-            "model": BaseClient.AGENT_MODEL,
-            "name": name,
-            "description": description,
-            "instructions": instructions
-        }
-        
-        if tools:
-            agent_args["tools"] = tools
+        # Only one coroutine resolves a given configuration; the others wait for its result
+        async with BaseClient._definition_locks[config_hash]:
+            definition = BaseClient._definitions.get(config_hash)
+            if definition:
+                return definition
+            
+            definition = await BaseClient._find_agent(client, name, config_hash)
+            if definition:
+                logger.debug("Reusing agent: %s", name)
+            else:
+                agent_args = {
+                    "model": BaseClient.AGENT_MODEL,
+                    "name": name,
+                    "description": description,
+                    "instructions": instructions,
+                    "metadata": {BaseClient.CONFIG_HASH_KEY: config_hash}
+                }
+                
+                if tools:
+                    agent_args["tools"] = tools
+                    
+                logger.debug("Creating agent: %s", name)
+                definition = await client.agents.create_agent(**agent_args)
             
-        logger.debug(f"Creating agent: {name}")
-        return await client.agents.create_agent(**agent_args)
+            BaseClient._definitions[config_hash] = definition
+            return definition
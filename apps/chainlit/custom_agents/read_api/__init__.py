@@ -2,6 +2,7 @@
 ReadAPIClient for managing read-only API agents.
 """
 
+import asyncio
 import logging
 from pathlib import Path
 import json
@@ -26,7 +27,31 @@ from custom_agents.read_api.constants import (
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Directory holding the OpenAPI specifications, independent of the working directory
+OPENAPI_DIR = Path(__file__).resolve().parents[2] / "openapi" / "mypetparlorapp"
+
 class ReadAPIClient(BaseClient):
+    # Read API agents as (agent key, OpenAPI spec name, API description, agent instructions)
+    API_AGENTS = [
+        ("address", "address", ADDRESS_API_DESC, ADDRESS_API_INSTRUCTIONS),
+        ("booking", "booking", BOOKING_API_DESC, BOOKING_API_INSTRUCTIONS),
+        ("customer", "customer", CUSTOMER_API_DESC, CUSTOMER_API_INSTRUCTIONS),
+        ("document", "document", DOCUMENT_API_DESC, DOCUMENT_API_INSTRUCTIONS),
+        ("employee", "employee", EMPLOYEE_API_DESC, EMPLOYEE_API_INSTRUCTIONS),
+        ("pet", "pet", PET_API_DESC, PET_API_INSTRUCTIONS),
+        ("team", "team", TEAM_API_DESC, TEAM_API_INSTRUCTIONS),
+        ("tenant", "tenants", TENANT_API_DESC, TENANT_API_INSTRUCTIONS)
+    ]
+    
+    # Names of the APIs whose OpenAPI specifications back the read agents
+    API_NAMES = [api_name for _, api_name, _, _ in API_AGENTS]
+    
+    # Parsed OpenAPI specifications shared across instances, keyed by API name
+    _spec_cache: Dict[str, dict] = {}
+    
+    # OpenAPI tools shared across instances, keyed by API name
+    _tool_cache: Dict[str, OpenApiTool] = {}
+    
     def __init__(self, client: AIProjectClient):
         """
         Initialize the Read API Client with the Azure AI Project Client to create and manage agents.
@@ -37,29 +62,50 @@ class ReadAPIClient(BaseClient):
         logger.debug("Initializing ReadAPIClient")
         self.client = client
         self.agent = None
-        self.openapi_dir = Path("openapi/mypetparlorapp")
+        self.openapi_dir = OPENAPI_DIR
         
     def _load_openapi_spec(self, api_name: str) -> dict:
         """
         Load OpenAPI specification from JSON file.
         
+        Specifications are parsed once per process and served from a cache
+        on subsequent calls.
+        
         Args:
             api_name: Name of the API (e.g., 'booking', 'customer')
             
         Returns:
             Dictionary containing the OpenAPI specification
         """
+        spec = ReadAPIClient._spec_cache.get(api_name)
+        if spec is not None:
+            return spec
+        
         spec_path = self.openapi_dir / api_name / "swagger.json"
-        if not spec_path.exists():
+        if not spec_path.is_file():
             raise FileNotFoundError(f"OpenAPI spec not found at {spec_path}")
             
-        with open(spec_path, "r") as f:
-            return json.load(f)
+        # Parse the raw bytes directly; json detects the encoding itself
+        spec = json.loads(spec_path.read_bytes())
+        
+        ReadAPIClient._spec_cache[api_name] = spec
+        return spec
+            
+    async def _preload_specs(self) -> None:
+        """
+        Load all OpenAPI specifications that are not yet cached concurrently,
+        off the event loop thread.
+        """
+        missing = [name for name in self.API_NAMES if name not in ReadAPIClient._spec_cache]
+        if missing:
+            await asyncio.gather(*(asyncio.to_thread(self._load_openapi_spec, name) for name in missing))
             
     def _create_api_tool(self, api_name: str, description: str) -> OpenApiTool:
         """
         Create an OpenAPI tool for the specified API.
         
+        Tools are built once per process and reused on subsequent calls.
+        
         Args:
             api_name: Name of the API (e.g., 'booking', 'customer')
             description: Detailed description of the API functionality
@@ -67,154 +113,47 @@ class ReadAPIClient(BaseClient):
         Returns:
             Configured OpenApiTool instance
         """
+        tool = ReadAPIClient._tool_cache.get(api_name)
+        if tool is not None:
+            return tool
+        
         spec = self._load_openapi_spec(api_name)
         auth = OpenApiAnonymousAuthDetails()
         
-        return OpenApiTool(
+        tool = OpenApiTool(
             name=f"{api_name}_api",
             spec=spec,
             description=description,
             auth=auth
         )
+        ReadAPIClient._tool_cache[api_name] = tool
+        return tool
         
-    async def _create_address_api_agent(self) -> AzureAIAgent:
-        """Create the address API specialized agent."""
-        logger.debug("Creating address API agent")
-        address_api = self._create_api_tool("address", ADDRESS_API_DESC)
-        address_api_definition = await self.create_agent(
-            client=self.client,
-            name="address_read_api",
-            description="Address API (read-only)",
-            instructions=ADDRESS_API_INSTRUCTIONS,
-            tools=address_api.definitions
-        )
-        return AzureAIAgent(
-            client=self.client,
-            definition=address_api_definition
-        )
-        
-    async def _create_booking_api_agent(self, scheduling_plugin) -> AzureAIAgent:
-        """
-        Create the booking API specialized agent.
-        
-        Args:
-            scheduling_plugin: Plugin for scheduling functionality
-        """
-        logger.debug("Creating booking API agent")
-        booking_api = self._create_api_tool("booking", BOOKING_API_DESC)
-        booking_api_definition = await self.create_agent(
-            client=self.client,
-            name="booking_read_api",
-            description="Booking API (read-only)",
-            instructions=BOOKING_API_INSTRUCTIONS,
-            tools=booking_api.definitions
-        )
-        return AzureAIAgent(
-            client=self.client,
-            definition=booking_api_definition,
-            plugins=[scheduling_plugin] if scheduling_plugin else None
-        )
-        
-    async def _create_customer_api_agent(self, importer_plugin) -> AzureAIAgent:
+    async def _create_api_agent(self, key: str, api_name: str, api_desc: str,
+                                instructions: str, plugin=None) -> AzureAIAgent:
         """
-        Create the customer API specialized agent.
+        Create a read-only API specialized agent.
         
         Args:
-            importer_plugin: Plugin for importing functionality
+            key: Short name of the agent (e.g., 'booking', 'tenant')
+            api_name: Name of the API whose OpenAPI specification backs the agent
+            api_desc: Detailed description of the API functionality
+            instructions: Instructions for the agent
+            plugin: Optional plugin to register on the agent
         """
-        logger.debug("Creating customer API agent")
-        customer_api = self._create_api_tool("customer", CUSTOMER_API_DESC)
-        customer_api_definition = await self.create_agent(
-            client=self.client,
-            name="customer_read_api",
-            description="Customer API (read-only)",
-            instructions=CUSTOMER_API_INSTRUCTIONS,
-            tools=customer_api.definitions
-        )
-        return AzureAIAgent(
+        logger.debug("Creating %s API agent", key)
+        api_tool = self._create_api_tool(api_name, api_desc)
+        api_definition = await self.create_agent(
             client=self.client,
-            definition=customer_api_definition,
-            plugins=[importer_plugin] if importer_plugin else None
-        )
-        
-    async def _create_document_api_agent(self) -> AzureAIAgent:
-        """Create the document API specialized agent."""
-        logger.debug("Creating document API agent")
-        document_api = self._create_api_tool("document", DOCUMENT_API_DESC)
-        document_api_definition = await self.create_agent(
-            client=self.client,
-            name="document_read_api",
-            description="Document API (read-only)",
-            instructions=DOCUMENT_API_INSTRUCTIONS,
-            tools=document_api.definitions
-        )
-        return AzureAIAgent(
-            client=self.client,
-            definition=document_api_definition
-        )
-        
-    async def _create_employee_api_agent(self) -> AzureAIAgent:
-        """Create the employee API specialized agent."""
-        logger.debug("Creating employee API agent")
-        employee_api = self._create_api_tool("employee", EMPLOYEE_API_DESC)
-        employee_api_definition = await self.create_agent(
-            client=self.client,
-            name="employee_read_api",
-            description="Employee API (read-only)",
-            instructions=EMPLOYEE_API_INSTRUCTIONS,
-            tools=employee_api.definitions
-        )
-        return AzureAIAgent(
-            client=self.client,
-            definition=employee_api_definition
-        )
-        
-    async def _create_pet_api_agent(self) -> AzureAIAgent:
-        """Create the pet API specialized agent."""
-        logger.debug("Creating pet API agent")
-        pet_api = self._create_api_tool("pet", PET_API_DESC)
-        pet_api_definition = await self.create_agent(
-            client=self.client,
-            name="pet_read_api",
-            description="Pet API (read-only)",
-            instructions=PET_API_INSTRUCTIONS,
-            tools=pet_api.definitions
-        )
-        return AzureAIAgent(
-            client=self.client,
-            definition=pet_api_definition
-        )
-        
-    async def _create_team_api_agent(self) -> AzureAIAgent:
-        """Create the team API specialized agent."""
-        logger.debug("Creating team API agent")
-        team_api = self._create_api_tool("team", TEAM_API_DESC)
-        team_api_definition = await self.create_agent(
-            client=self.client,
-            name="team_read_api",
-            description="Team API (read-only)",
-            instructions=TEAM_API_INSTRUCTIONS,
-            tools=team_api.definitions
+            name=f"{key}_read_api",
+            description=f"{key.capitalize()} API (read-only)",
+            instructions=instructions,
+            tools=api_tool.definitions
         )
         return AzureAIAgent(
             client=self.client,
-            definition=team_api_definition
-        )
-        
-    async def _create_tenant_api_agent(self) -> AzureAIAgent:
-        """Create the tenant API specialized agent."""
-        logger.debug("Creating tenant API agent")
-        tenant_api = self._create_api_tool("tenants", TENANT_API_DESC)
-        tenant_api_definition = await self.create_agent(
-            client=self.client,
-            name="tenant_read_api",
-            description="Tenant API (read-only)",
-            instructions=TENANT_API_INSTRUCTIONS,
-            tools=tenant_api.definitions
-        )
-        return AzureAIAgent(
-            client=self.client,
-            definition=tenant_api_definition
+            definition=api_definition,
+            plugins=[plugin] if plugin else None
         )
         
     async def initialize(self, scheduling_plugin=None, importer_plugin=None) -> Dict[str, AzureAIAgent]:
@@ -230,27 +169,18 @@ class ReadAPIClient(BaseClient):
         """
         logger.debug("Initializing all read API agents")
         
-        # Create all specialized API agents
-        address_agent = await self._create_address_api_agent()
-        booking_agent = await self._create_booking_api_agent(scheduling_plugin)
-        customer_agent = await self._create_customer_api_agent(importer_plugin)
-        document_agent = await self._create_document_api_agent()
-        employee_agent = await self._create_employee_api_agent()
-        pet_agent = await self._create_pet_api_agent()
-        team_agent = await self._create_team_api_agent()
-        tenant_agent = await self._create_tenant_api_agent()
+        # Read the specification files in worker threads so the event loop stays responsive
+        await self._preload_specs()
+        
+        # Create all specialized API agents concurrently; each is an independent service round-trip
+        plugins = {"booking": scheduling_plugin, "customer": importer_plugin}
+        created_agents = await asyncio.gather(*(
+            self._create_api_agent(key, api_name, api_desc, instructions, plugins.get(key))
+            for key, api_name, api_desc, instructions in self.API_AGENTS
+        ))
         
         # Return all agents in a dictionary for easy access
-        agents = {
-            "address": address_agent,
-            "booking": booking_agent,
-            "customer": customer_agent,
-            "document": document_agent,
-            "employee": employee_agent,
-            "pet": pet_agent,
-            "team": team_agent,
-            "tenant": tenant_agent
-        }
+        agents = {key: agent for (key, _, _, _), agent in zip(self.API_AGENTS, created_agents)}
         
         logger.debug("ReadAPIClient initialized successfully")
         return agents 
\ No newline at end of file
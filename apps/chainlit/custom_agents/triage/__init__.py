@@ -10,7 +10,10 @@ from azure.ai.projects.models import CodeInterpreterTool
 from semantic_kernel.agents import AzureAIAgent
 
 from custom_agents.base_client import BaseClient
-from custom_agents.triage.constants import TRIAGE_INSTRUCTIONS
+from custom_agents.triage.constants import (
+    DATA_ANALYSIS_DESC, DATA_ANALYSIS_INSTRUCTIONS,
+    TRIAGE_INSTRUCTIONS
+)
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -27,16 +30,20 @@ class TriageClient(BaseClient):
         self.client = client
         self.agent = None
         
-    async def _create_data_analysis_agent(self) -> AzureAIAgent:
-        """Create the data analysis specialized agent."""
+    async def create_data_analysis_agent(self) -> AzureAIAgent:
+        """
+        Create the data analysis specialized agent.
+        
+        It does not depend on any other agent, so callers may create it
+        concurrently with the other specialized agents and pass it to initialize.
+        """
         logger.debug("Creating data analysis agent")
         code_interpreter = CodeInterpreterTool()
         data_analysis_definition = await self.create_agent(
             client=self.client,
             name="data_analysis",
-            description="An expert in analyzing data that MUST be already fetched from its source (e.g. API) in a previous step",
-            instructions="""You are an expert in analyzing fetched data.
-            You can use the Code Interpreter tool to run queries and advanced analysis on the data.""",
+            description=DATA_ANALYSIS_DESC,
+            instructions=DATA_ANALYSIS_INSTRUCTIONS,
             tools=code_interpreter.definitions
         )
         return AzureAIAgent(
@@ -59,21 +66,24 @@ class TriageClient(BaseClient):
             plugins=plugins
         )
         
-    async def initialize(self, setup_guide_agent: AzureAIAgent, api_agents: Dict[str, AzureAIAgent]) -> AzureAIAgent:
+    async def initialize(self, setup_guide_agent: AzureAIAgent, api_agents: Dict[str, AzureAIAgent],
+                         data_analysis_agent: Optional[AzureAIAgent] = None) -> AzureAIAgent:
         """
         Initializes the triage agent with all its plugins.
         
         Args:
             setup_guide_agent: The setup guide agent to use as a plugin
             api_agents: Dictionary of API agents to use as plugins
+            data_analysis_agent: Optional data analysis agent to use as a plugin; created if not provided
             
         Returns:
             The initialized triage agent
         """
         logger.debug("Initializing triage agent")
         
-        # Create data analysis agent
-        data_analysis_agent = await self._create_data_analysis_agent()
+        # Create data analysis agent unless the caller already did
+        if data_analysis_agent is None:
+            data_analysis_agent = await self.create_data_analysis_agent()
         
         # Create the main triage agent with all plugins
         self.agent = await self._create_triage_agent(
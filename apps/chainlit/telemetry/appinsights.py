@@ -1,4 +1,7 @@
 import logging
+import os
+import threading
+from typing import Dict, Optional, Tuple
 from azure.monitor.opentelemetry.exporter import (
     AzureMonitorLogExporter,
     AzureMonitorMetricExporter,
@@ -17,6 +20,51 @@ from opentelemetry.sdk.trace.export import BatchSpanProcessor
 from opentelemetry.semconv.resource import ResourceAttributes
 from opentelemetry.trace import set_tracer_provider, get_tracer_provider
 
+# Batch processor queue and batch sizes, sized above the SDK defaults (2048/512) so bursts
+# of chat activity are not dropped; the standard OTEL_BLRP_* and OTEL_BSP_* variables override them
+BATCH_MAX_QUEUE_SIZE = 8192
+BATCH_MAX_EXPORT_BATCH_SIZE = 1024
+
+
+def _env_int(name: str, default: int) -> int:
+    """
+    Read a positive integer setting from an environment variable.
+
+    Args:
+        name (str): Name of the environment variable.
+        default (int): Value used when the variable is unset, empty or invalid.
+    """
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number <= 0:
+        logging.getLogger(__name__).warning("Ignoring invalid %s=%r, using %d", name, value, default)
+        return default
+    return number
+
+
+def _batch_sizes(prefix: str) -> Tuple[int, int]:
+    """
+    Read the queue and export batch sizes of a batch processor from the environment.
+
+    The SDK rejects an export batch larger than the queue, so when only the queue
+    size is overridden the default batch size is lowered to fit it.
+
+    Args:
+        prefix (str): Prefix of the environment variables, e.g. "OTEL_BSP".
+
+    Returns:
+        Tuple[int, int]: The max queue size and the max export batch size.
+    """
+    max_queue_size = _env_int(f"{prefix}_MAX_QUEUE_SIZE", BATCH_MAX_QUEUE_SIZE)
+    max_export_batch_size = _env_int(f"{prefix}_MAX_EXPORT_BATCH_SIZE",
+                                     min(BATCH_MAX_EXPORT_BATCH_SIZE, max_queue_size))
+    return max_queue_size, max_export_batch_size
+
 
 class AzureMonitor:
     """
@@ -40,22 +88,30 @@ class AzureMonitor:
         self.logger.info("Setting up logging")
         exporter = AzureMonitorLogExporter(connection_string=self.connection_string)
 
-        # Create and set a global logger provider for the application.
-        logger_provider = get_logger_provider() or LoggerProvider(resource=self.resource)
+        # Reuse the global SDK logger provider if one is installed, otherwise create and set one.
+        # Until a provider is set the API returns a no-op proxy, so check the type rather than truthiness.
+        logger_provider = get_logger_provider()
+        if not isinstance(logger_provider, LoggerProvider):
+            logger_provider = LoggerProvider(resource=self.resource)
+            # Sets the global default logger provider
+            set_logger_provider(logger_provider)
         # Log processors are initialized with an exporter which is responsible
         # for sending the telemetry data to a particular backend.
-        logger_provider.add_log_record_processor(BatchLogRecordProcessor(exporter))
-        # Sets the global default logger provider
-        set_logger_provider(logger_provider)
+        # Schedule delay and export timeout are left to the SDK, which reads them from OTEL_BLRP_*.
+        max_queue_size, max_export_batch_size = _batch_sizes("OTEL_BLRP")
+        logger_provider.add_log_record_processor(BatchLogRecordProcessor(
+            exporter,
+            max_queue_size=max_queue_size,
+            max_export_batch_size=max_export_batch_size,
+        ))
 
         # Create a logging handler to write logging records, in OTLP format, to the exporter.
         handler = LoggingHandler()
-        # Add filters to the handler to only process records from semantic_kernel.
-        handler.addFilter(logging.Filter("semantic_kernel"))
-        # Attach the handler to the root logger. `getLogger()` with no arguments returns the root logger.
-        # Events from all child loggers will be processed by this handler.
-        logger = logging.getLogger()
-        logger.addHandler(handler)
+        # Attach the handler to the semantic_kernel logger only, so records from other libraries
+        # never reach it, and enable INFO there without lowering the level of the root logger.
+        logger = logging.getLogger("semantic_kernel")
+        if not any(isinstance(existing, LoggingHandler) for existing in logger.handlers):
+            logger.addHandler(handler)
         logger.setLevel(logging.INFO)
 
     def set_up_tracing(self):
@@ -63,22 +119,42 @@ class AzureMonitor:
         self.logger.info("Setting up tracing")
         exporter = AzureMonitorTraceExporter(connection_string=self.connection_string)
 
-        # Initialize a trace provider for the application. This is a factory for creating tracers.
-        tracer_provider = get_tracer_provider() or TracerProvider(resource=self.resource)
+        # Reuse the global SDK trace provider if one is installed, otherwise create and set one.
+        # A trace provider is a factory for creating tracers.
+        tracer_provider = get_tracer_provider()
+        if not isinstance(tracer_provider, TracerProvider):
+            tracer_provider = TracerProvider(resource=self.resource)
+            # Sets the global default tracer provider
+            set_tracer_provider(tracer_provider)
         # Span processors are initialized with an exporter which is responsible
         # for sending the telemetry data to a particular backend.
-        tracer_provider.add_span_processor(BatchSpanProcessor(exporter))
-        # Sets the global default tracer provider
-        set_tracer_provider(tracer_provider)
+        # Schedule delay and export timeout are left to the SDK, which reads them from OTEL_BSP_*.
+        max_queue_size, max_export_batch_size = _batch_sizes("OTEL_BSP")
+        tracer_provider.add_span_processor(BatchSpanProcessor(
+            exporter,
+            max_queue_size=max_queue_size,
+            max_export_batch_size=max_export_batch_size,
+        ))
 
     def set_up_metrics(self):
-        """Set up metrics with Azure Monitor."""
+        """
+        Set up metrics with Azure Monitor.
+
+        Metrics are exported every 60 seconds by default; set OTEL_METRIC_EXPORT_INTERVAL
+        and OTEL_METRIC_EXPORT_TIMEOUT (in milliseconds) to change the cadence.
+        """
         self.logger.info("Setting up metrics")
+
+        # Metric readers cannot be added to an existing SDK meter provider, and the global one can only be set once.
+        if isinstance(get_meter_provider(), MeterProvider):
+            self.logger.info("Meter provider already configured, keeping it")
+            return
+
         exporter = AzureMonitorMetricExporter(connection_string=self.connection_string)
 
         # Initialize a metric provider for the application. This is a factory for creating meters.
-        meter_provider = get_meter_provider() or MeterProvider(
-            metric_readers=[PeriodicExportingMetricReader(exporter, export_interval_millis=5000)],
+        meter_provider = MeterProvider(
+            metric_readers=[PeriodicExportingMetricReader(exporter)],
             resource=self.resource,
             views=[
                 # Dropping all instrument names except for those starting with "semantic_kernel"
@@ -100,12 +176,33 @@ class AzureMonitor:
         self.logger.info("Application Insights configuration complete")
 
 
-def configure_application_insights(connection_string: str):
+# Configurators already applied in this process, keyed by connection string
+_configured: Dict[str, AzureMonitor] = {}
+_configured_lock = threading.Lock()
+
+
+def configure_application_insights(connection_string: str) -> Optional[AzureMonitor]:
     """
     Configure Application Insights by setting up logging, tracing, and metrics.
 
+    Configuration is applied once per connection string; repeated calls return the
+    existing configurator instead of registering duplicate exporters. An empty
+    connection string disables telemetry, so no providers or export threads are started.
+
     Args:
         connection_string (str): The connection string for Application Insights resource.
+
+    Returns:
+        Optional[AzureMonitor]: The configurator applied for the connection string, or None if disabled.
     """
-    configurator = AzureMonitor(connection_string)
-    configurator.configure()
+    if not connection_string:
+        logging.getLogger(__name__).info("Application Insights disabled: no connection string")
+        return None
+
+    with _configured_lock:
+        configurator = _configured.get(connection_string)
+        if configurator is None:
+            configurator = AzureMonitor(connection_string)
+            configurator.configure()
+            _configured[connection_string] = configurator
+        return configurator